@@ -1,4 +1,4 @@
 @echo off
 @chcp 65001 >nul
-pip install opencv-python numpy pillow
+pip install opencv-python numpy pillow imagequant orjson
 pause
\ No newline at end of file
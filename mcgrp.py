@@ -1,144 +1,265 @@
 import configparser
+import math
 import os
 import json
 import re
 import subprocess
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import numpy as np
 import cv2
 from PIL import Image
 
+try:
+    import imagequant  # 可选：libimagequant绑定，缺失时回退到pngquant.exe
+except ImportError:
+    imagequant = None
+
+try:
+    import orjson  # 可选：C实现的JSON序列化，缺失时回退到标准库json
+except ImportError:
+    orjson = None
+
+# 每个线程复用一块画布缓冲区，避免每张图片都重新分配
+_CANVAS_POOL = threading.local()
+
+# JSON模板中模型名的占位符
+MODEL_NAME_SLOT = '{model_name}'
+
+# 文件名清理：非ASCII名称使用正则（\w可匹配中文等字符），纯ASCII名称使用更快的str.translate
+_SANITIZE_RE = re.compile(r"[^\w-]")
+_SANITIZE_TABLE = str.maketrans('', '', ''.join(
+    chr(c) for c in range(128) if not (chr(c).isalnum() or chr(c) in '_-')
+))
+
 
 def sanitize_filename(filename):
     """清理文件名并强制使用.png扩展名"""
-    name = os.path.splitext(filename)[0]  # 分离原始扩展名
-    clean_name = re.sub(r"[^\w-]", "", name.replace(' ', '_'))
+    name = os.path.splitext(filename)[0].replace(' ', '_')  # 分离原始扩展名
+    if name.isascii():
+        clean_name = name.translate(_SANITIZE_TABLE)
+    else:
+        clean_name = _SANITIZE_RE.sub("", name)
     return f"{clean_name}.png".lower()  # 强制使用.png扩展名
 
 
 def crop_to_content_cv2(img_np):
-    """使用OpenCV裁剪透明边框"""
-    if img_np.shape[2] == 4:
-        alpha = img_np[:, :, 3]
-    else:
-        alpha = np.full(img_np.shape[:2], 255, dtype=np.uint8)
+    """裁剪透明边框（按行/列归约求包围盒，不生成逐像素坐标列表）"""
+    if img_np.shape[2] != 4:
+        return img_np
+    alpha = img_np[:, :, 3]
+
+    # 四个角都不透明时包围盒就是整张图
+    if alpha[0, 0] and alpha[0, -1] and alpha[-1, 0] and alpha[-1, -1]:
+        return img_np
     
-    coords = cv2.findNonZero(alpha)
-    if coords is None:
+    rows = np.any(alpha, axis=1)
+    if not rows.any():
         return img_np
+    cols = np.any(alpha, axis=0)
     
-    x, y, w, h = cv2.boundingRect(coords)
-    return img_np[y:y+h, x:x+w]
+    y0, y1 = rows.argmax(), len(rows) - rows[::-1].argmax()
+    x0, x1 = cols.argmax(), len(cols) - cols[::-1].argmax()
+    return img_np[y0:y1, x0:x1]
 
 
 def process_image_cv2(img_np, autofit):
-    """OpenCV处理核心逻辑（保持原有功能不变）"""
+    """OpenCV处理核心逻辑（非autofit模式返回的画布会在下次调用时复用）"""
     target_size = (650, 900)
     img_np = crop_to_content_cv2(img_np)
     
     h, w = img_np.shape[:2]
     target_w, target_h = target_size
     
+    # 缩小用INTER_AREA效果最好；放大时INTER_AREA会退化且更慢，改用INTER_LINEAR
     if autofit:
-        return cv2.resize(img_np, target_size, interpolation=cv2.INTER_AREA)
+        interp = cv2.INTER_AREA if (h > target_h or w > target_w) else cv2.INTER_LINEAR
+        return cv2.resize(img_np, target_size, interpolation=interp)
     else:
         scale = min(target_w / w, target_h / h)
         new_size = (int(w * scale), int(h * scale))
-        resized = cv2.resize(img_np, new_size, interpolation=cv2.INTER_AREA)
+        interp = cv2.INTER_AREA if scale < 1.0 else cv2.INTER_LINEAR
         
-        canvas = np.zeros((target_h, target_w, 4), dtype=np.uint8)
+        canvas = getattr(_CANVAS_POOL, 'buf', None)
+        if canvas is None:
+            canvas = _CANVAS_POOL.buf = np.empty((target_h, target_w, 4), dtype=np.uint8)
         y_offset = (target_h - new_size[1]) // 2
         x_offset = (target_w - new_size[0]) // 2
-        
-        if resized.shape[2] == 4:
-            alpha = resized[:, :, 3] / 255.0
-            for c in range(3):
-                canvas[y_offset:y_offset+new_size[1], x_offset:x_offset+new_size[0], c] = \
-                    resized[:, :, c] * alpha + canvas[y_offset:y_offset+new_size[1], x_offset:x_offset+new_size[0], c] * (1 - alpha)
-            canvas[y_offset:y_offset+new_size[1], x_offset:x_offset+new_size[0], 3] = \
-                np.maximum(resized[:, :, 3], canvas[y_offset:y_offset+new_size[1], x_offset:x_offset+new_size[0], 3])
-        else:
-            canvas[y_offset:y_offset+new_size[1], x_offset:x_offset+new_size[0], :3] = resized
-            canvas[y_offset:y_offset+new_size[1], x_offset:x_offset+new_size[0], 3] = 255
+        y_end = y_offset + new_size[1]
+        x_end = x_offset + new_size[0]
+
+        # 贴图区域会被完整覆盖，只需清空其四周的边框
+        canvas[:y_offset] = 0
+        canvas[y_end:] = 0
+        canvas[y_offset:y_end, :x_offset] = 0
+        canvas[y_offset:y_end, x_end:] = 0
+
+        # 直接缩放写入画布的贴图区域（load_image已保证为4通道），省去中间结果和拷贝
+        cv2.resize(
+            img_np,
+            new_size,
+            dst=canvas[y_offset:y_end, x_offset:x_end],
+            interpolation=interp
+        )
         
         return canvas
 
 
 def load_image(path):
-    """加载图像并确保RGBA格式"""
+    """加载图像并确保BGRA格式（保持OpenCV原生通道顺序，保存时再交给Pillow转换）"""
     img_np = cv2.imread(path, cv2.IMREAD_UNCHANGED)
     if img_np is None:
         raise ValueError(f"无法读取图像: {path}")
     
-    # 转换通道顺序并添加Alpha通道
+    # 补充Alpha通道
     if img_np.shape[2] == 3:
-        img_np = cv2.cvtColor(img_np, cv2.COLOR_BGR2RGBA)
-    elif img_np.shape[2] == 4:
-        img_np = cv2.cvtColor(img_np, cv2.COLOR_BGRA2RGBA)
+        img_np = cv2.cvtColor(img_np, cv2.COLOR_BGR2BGRA)
     return img_np
 
 
+def to_pil_image(img_np):
+    """BGRA数组转为Pillow的RGBA图像，通道转换在Pillow解包时完成"""
+    # frombuffer要求连续内存；本流程传入的画布和缩放结果本就连续，此处仅为防御外部调用传入切片视图
+    if not img_np.flags['C_CONTIGUOUS']:
+        img_np = np.ascontiguousarray(img_np)
+    h, w = img_np.shape[:2]
+    return Image.frombuffer('RGBA', (w, h), img_np, 'raw', 'BGRA', 0, 1)
+
+
 def save_image_png(img_np, path, quality, use_pngquant=False, colors=256):
-    """确保保存为PNG格式"""
+    """保存为PNG，path须已是.png路径（未安装imagequant时，pngquant.exe由run_pngquant统一批量处理）"""
+    # 每条路径都只有这一个写入者（pngquant.exe之后原地覆盖），直接写最终文件即可，无需临时文件
     try:
-        # 强制.png扩展名
-        path = os.path.splitext(path)[0] + ".png"
+        # 进程内调用libimagequant（即pngquant的量化库），无需中间文件和子进程
+        if use_pngquant and imagequant is not None:
+            img_pil = to_pil_image(img_np)
+            try:
+                img_pil = imagequant.quantize_pil_image(
+                    img_pil,
+                    dithering_level=1.0,
+                    max_colors=colors,
+                    min_quality=60,
+                    max_quality=90
+                )
+            except RuntimeError as e:
+                # 与pngquant.exe失败时一致：保留未量化的图片
+                print(f"pngquant错误: {str(e)}")
+            img_pil.save(path, 'PNG', optimize=True)
         
-        # 转换到Pillow格式
-        if img_np.shape[2] == 4:
-            img_pil = Image.fromarray(img_np, 'RGBA')
-        else:
-            img_pil = Image.fromarray(cv2.cvtColor(img_np, cv2.COLOR_RGB2RGBA))
-        
-        temp_path = path + ".tmp.png"
-        
-        # 压缩逻辑保持不变
-        if quality < 100:
+        # 启用pngquant时由其直接从全彩图量化（效果更好），跳过Pillow的中位切分量化
+        elif quality < 100 and not use_pngquant:
+            img_pil = to_pil_image(img_np)
             alpha = img_pil.split()[-1]
             rgb = img_pil.convert('RGB')
             pillow_colors = max(2, int(256 * quality / 100))
             quant = rgb.quantize(colors=pillow_colors, method=Image.MEDIANCUT)
             quant_rgba = quant.convert('RGBA')
             quant_rgba.putalpha(alpha)
-            quant_rgba.save(temp_path, 'PNG', optimize=True, compress_level=9)
+            quant_rgba.save(path, 'PNG', optimize=True, compress_level=9)
         else:
-            img_pil.save(temp_path, 'PNG', optimize=True)
-
-        # pngquant处理
-        if use_pngquant:
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            pngquant_path = os.path.join(script_dir, 'pngquant.exe')
-            
-            cmd = [
-                pngquant_path,
-                str(colors),
-                '--quality', '60-90',
-                '--speed', '3',
-                '--strip',
-                '--force',
-                '--output', path,
-                temp_path
-            ]
+            # 无损保存直接由OpenCV编码（数据本就是BGRA），不经过Pillow；
+            # 压缩级别6比9快数倍，体积几乎不变。用imencode+tofile以支持非ASCII路径
+            ok, buf = cv2.imencode('.png', img_np, [cv2.IMWRITE_PNG_COMPRESSION, 6])
+            if not ok:
+                raise ValueError("PNG编码失败")
+            buf.tofile(path)
             
+    except Exception as e:
+        print(f"图片保存失败: {str(e)}")
+        # 不保留写了一半的文件
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def run_pngquant(paths, colors, max_batch_size=64):
+    """批量调用pngquant.exe原地压缩，按CPU核心数分批并行，每个进程处理多张图片"""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    pngquant_path = os.path.join(script_dir, 'pngquant.exe')
+
+    def run_batch(batch):
+        cmd = [
+            pngquant_path,
+            str(colors),
+            '--quality', '60-90',
+            '--speed', '3',
+            '--strip',
+            '--force',
+            '--ext', '.png',  # 配合--force直接覆盖原文件
+            *batch
+        ]
+        
+        # 失败时只影响本批次：pngquant不会改写这些图片，保留未压缩的版本
+        try:
             result = subprocess.run(
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 creationflags=subprocess.CREATE_NO_WINDOW
             )
-            
-            if result.returncode not in [0, 98]:
-                print(f"pngquant错误: {result.stderr.decode('utf-8')}")
-                os.replace(temp_path, path)
-            else:
-                os.remove(temp_path)
-        else:
-            os.replace(temp_path, path)
-            
-    except Exception as e:
-        print(f"图片保存失败: {str(e)}")
-        if os.path.exists(temp_path):
-            os.remove(temp_path)
+        except (OSError, ValueError) as e:
+            print(f"pngquant错误: {str(e)}")
+            return
+        
+        if result.returncode not in [0, 98]:
+            print(f"pngquant错误: {result.stderr.decode('utf-8', errors='replace')}")
+
+    # pngquant.exe是单线程的：先按核心数均分以保证并行，
+    # max_batch_size仅作为上限，避免超出Windows命令行长度限制
+    workers = os.cpu_count() or 1
+    batch_size = max(1, min(max_batch_size, math.ceil(len(paths) / workers)))
+    batches = [paths[i:i + batch_size] for i in range(0, len(paths), batch_size)]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(run_batch, batches))
+
+
+def dumps_json(obj):
+    """序列化为带缩进的JSON字节串"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def build_json_templates(namespace, has_back):
+    """生成item模型与3D模型的JSON字节模板，纹理路径中的模型名以MODEL_NAME_SLOT占位
+
+    每次调用都新建字典，模板之间不共享可变状态。
+    """
+    base_texture = f"{namespace}:item/{MODEL_NAME_SLOT}"
+    back_texture = f"{namespace}:item/back" if has_back else base_texture
+    item_data = {"model": {"type": "minecraft:model", "model": base_texture}}
+    model_data = {
+        "credit": "Made with Blockbench",
+        "texture_size": [650, 900],
+        "textures": {"0": back_texture, "1": base_texture, "particle": back_texture},
+        "elements": [{"from": [2,0,8],"to": [16,18,8],"rotation": {"angle":0,"axis":"x","origin":[9,9,8]},
+            "faces": {"north":{"uv":[16,16,0,0],"rotation":180,"texture":"#0"},
+                      "south":{"uv":[0,0,16,16],"texture":"#1"}}}],
+        "gui_light": "front",
+        "display": {"thirdperson_righthand": {"rotation":[49.5,0,0],"translation":[0,1,1.25],"scale":[0.20703,0.20703,0.20703]},
+                    "thirdperson_lefthand": {"rotation":[49.5,0,0],"translation":[0,1,1.25],"scale":[0.20703,0.20703,0.20703]},
+                    "firstperson_righthand":{"translation":[-10,8,-4]},"firstperson_lefthand":{"translation":[-10,8,-4]},
+                    "ground":{"translation":[0,1.75,0],"scale":[0.2,0.2,1]},"gui":{"translation":[-1,0,0]},
+                    "fixed":{"rotation":[0,180,0],"translation":[1.25,-1,0.5]}}}
+    return dumps_json(item_data), dumps_json(model_data)
+
 
+def write_file(args):
+    """写入(路径, 字节串)对应的文件"""
+    path, data = args
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def process_one(args):
+    """处理单张卡片图片（在子进程中运行），返回(输出文件名, 原文件名, 错误信息)"""
+    filename, output_name, output_path, autofit, quality, use_pngquant, colors = args
+    try:
+        img_np = load_image(os.path.join('images', filename))
+        processed = process_image_cv2(img_np, autofit)
+        save_image_png(processed, output_path, quality, use_pngquant, colors)
+        return output_name, filename, None
+    except Exception as e:
+        return output_name, filename, str(e)
 
 
 def main():
@@ -198,128 +319,121 @@ def main():
     pngquant_colors = int(conf.get('pngquant_color', '256'))
 
     # ========== 初始化变量 ==========
-    name_mapping = {}
-    current_id = start_id
+    model_names = []
+    # 未安装imagequant时，所有纹理写完后再批量调用pngquant.exe
+    batch_pngquant = use_pngquant and imagequant is None
+    pngquant_paths = []
 
     # ========== 目录结构创建 ==========
     os.makedirs('images', exist_ok=True)
     assets_path = os.path.join(output_dir, 'assets', namespace)
-    for dir_path in [
-        os.path.join(assets_path, 'items'),
-        os.path.join(assets_path, 'models', 'item'),
-        os.path.join(assets_path, 'textures', 'item')
-    ]:
+    # 预先拼好目录前缀，循环内只需一次字符串拼接
+    items_dir = os.path.join(assets_path, 'items') + os.sep
+    models_dir = os.path.join(assets_path, 'models', 'item') + os.sep
+    textures_dir = os.path.join(assets_path, 'textures', 'item') + os.sep
+    for dir_path in [items_dir, models_dir, textures_dir]:
         os.makedirs(dir_path, exist_ok=True)
 
   # ========== 图片处理 ==========
     has_back = False
     valid_ext = ('.png', '.jpg', '.jpeg')
-    image_files = [f for f in os.listdir('images') if f.lower().endswith(valid_ext)]
 
-    # 处理 back.png（使用OpenCV）
-    back_files = [f for f in image_files if os.path.splitext(f)[0].lower() == 'back']
-    if back_files:
-        back_source = back_files[0]
-        try:
-            img_np = load_image(os.path.join('images', back_source))
-            processed = process_image_cv2(img_np, autofit)
-            back_name = 'back.png'
-            back_path = os.path.join(assets_path, 'textures', 'item', back_name)
-            save_image_png(
-                processed,
-                back_path,
-                compress_quality,
-                use_pngquant=use_pngquant,
-                colors=pngquant_colors
-            )
-            print(f"已处理背景图片：{back_source} → {back_name}")
-            image_files.remove(back_source)
-            has_back = True
-        except Exception as e:
-            print(f"背景图片处理错误：{str(e)}")
-    else:
+    # 一次遍历完成扩展名过滤，并分出 back.png（它不作为卡片参与编号）
+    back_source = None
+    image_files = []
+    for f in os.listdir('images'):
+        lower_name = f.lower()
+        if not lower_name.endswith(valid_ext):
+            continue
+        if back_source is None and os.path.splitext(lower_name)[0] == 'back':
+            back_source = f
+        else:
+            image_files.append(f)
+    if back_source is None:
         print("警告：未找到 back.png！将使用卡片正面作为背面纹理")
 
-    # 处理其他图片（使用OpenCV加速）
-    texture_count = 0
-    total = len(image_files)
-    
-    for idx, filename in enumerate(image_files, 1):
-        try:
-            img_np = load_image(os.path.join('images', filename))
-            processed = process_image_cv2(img_np, autofit)
-            
-            if mode == 'id':
-                output_name = f"{current_id}.png"
-                current_id += 1
-            else:
-                output_name = sanitize_filename(filename)
-                name_mapping[output_name] = {
-                    'original': filename,
-                    'clean_name': os.path.splitext(output_name)[0]
-                }
-            
-            output_path = os.path.join(assets_path, 'textures', 'item', output_name)
-            save_image_png(
-                processed,
-                output_path,
-                compress_quality,
-                use_pngquant,
-                pngquant_colors
-            )
-            
+    # 处理其他图片（多进程并行，使用OpenCV加速）
+    # 分发前预先分配ID/文件名，保证输出确定，子进程之间无需共享计数器
+    tasks = {}
+    for idx, filename in enumerate(image_files):
+        if mode == 'id':
+            output_name = f"{start_id + idx}.png"
+        else:
+            output_name = sanitize_filename(filename)
+        # back.png 由主进程在卡片处理期间同时写入，同名卡片会与其争用同一文件，直接跳过
+        if back_source is not None and output_name == 'back.png':
+            print(f"警告：{filename} 与背景纹理 back.png 重名，已跳过")
+            continue
+        # 同名文件只保留最后一个，避免多个进程同时写入同一纹理
+        tasks[output_name] = (
+            filename,
+            output_name,
+            textures_dir + output_name,
+            autofit,
+            compress_quality,
+            use_pngquant,
+            pngquant_colors
+        )
+
+    total = len(tasks)
+    with ProcessPoolExecutor() as executor:  # 默认进程数为CPU核心数
+        # 任务提交后子进程立即开始处理卡片，主进程同时处理 back.png，使其解码与卡片处理重叠
+        results = executor.map(process_one, tasks.values(), chunksize=4)
+
+        # 处理 back.png（使用OpenCV）
+        if back_source is not None:
+            try:
+                img_np = load_image(os.path.join('images', back_source))
+                processed = process_image_cv2(img_np, autofit)
+                back_name = 'back.png'
+                back_path = textures_dir + back_name
+                save_image_png(
+                    processed,
+                    back_path,
+                    compress_quality,
+                    use_pngquant=use_pngquant,
+                    colors=pngquant_colors
+                )
+                print(f"已处理背景图片：{back_source} → {back_name}")
+                has_back = True
+                pngquant_paths.append(back_path)
+            except Exception as e:
+                print(f"背景图片处理错误：{str(e)}")
+
+        for idx, (output_name, filename, error) in enumerate(results, 1):
+            if error is not None:
+                print(f"图片处理失败：{filename} - {error}")
+                continue
+            model_names.append(os.path.splitext(output_name)[0])
+            pngquant_paths.append(tasks[output_name][2])
             print(f"进度：{idx}/{total} → {output_name}")
-            texture_count += 1
-        except Exception as e:
-            print(f"图片处理失败：{filename} - {str(e)}")
 
-    # ========== 生成JSON文件 ==========
-    MODEL_TEMPLATE = {
-        "credit": "Made with Blockbench",
-        "texture_size": [650, 900],
-        "textures": {"0": f"{namespace}:item/back", "1": "{texture_id}", "particle": f"{namespace}:item/back"},
-        "elements": [{"from": [2,0,8],"to": [16,18,8],"rotation": {"angle":0,"axis":"x","origin":[9,9,8]},
-            "faces": {"north":{"uv":[16,16,0,0],"rotation":180,"texture":"#0"},
-                      "south":{"uv":[0,0,16,16],"texture":"#1"}}}],
-        "gui_light": "front",
-        "display": {"thirdperson_righthand": {"rotation":[49.5,0,0],"translation":[0,1,1.25],"scale":[0.20703,0.20703,0.20703]},
-                    "thirdperson_lefthand": {"rotation":[49.5,0,0],"translation":[0,1,1.25],"scale":[0.20703,0.20703,0.20703]},
-                    "firstperson_righthand":{"translation":[-10,8,-4]},"firstperson_lefthand":{"translation":[-10,8,-4]},
-                    "ground":{"translation":[0,1.75,0],"scale":[0.2,0.2,1]},"gui":{"translation":[-1,0,0]},
-                    "fixed":{"rotation":[0,180,0],"translation":[1.25,-1,0.5]}}}
+    if batch_pngquant and pngquant_paths:
+        print(f"正在使用pngquant压缩 {len(pngquant_paths)} 张图片...")
+        run_pngquant(pngquant_paths, pngquant_colors)
 
-    # 生成item模型JSON
-    for item_info in (range(start_id, start_id + texture_count) if mode == 'id' else name_mapping.values()):
-        if mode == 'id':
-            item_id = item_info
-            model_name = str(item_id)
-            item_path = os.path.join(assets_path, 'items', f'{item_id}.json')
-        else:
-            model_name = item_info['clean_name']
-            item_path = os.path.join(assets_path, 'items', f'{model_name}.json')
-
-        with open(item_path, 'w') as f:
-            json.dump({
-                "model": {"type": "minecraft:model", "model": f"{namespace}:item/{model_name}"}
-            }, f, indent=4)
-
-        # 生成3D模型JSON
-        model_data = MODEL_TEMPLATE.copy()
-        base_texture = f"{namespace}:item/{model_name}"
-        if not has_back:
-            model_data["textures"]["0"] = base_texture
-            model_data["textures"]["particle"] = base_texture
-        model_data["textures"]["1"] = base_texture
-        
-        model_path = os.path.join(assets_path, 'models', 'item', f'{model_name}.json')
-        with open(model_path, 'w') as f:
-            json.dump(model_data, f, indent=4)
+    # ========== 生成JSON文件 ==========
+    # 模板只序列化一次，循环内仅替换模型名占位符
+    item_template, model_template = build_json_templates(namespace, has_back)
+    name_slot = MODEL_NAME_SLOT.encode('utf-8')
+
+    json_files = []
+    for model_name in model_names:
+        name_bytes = model_name.encode('utf-8')
+        # item模型JSON
+        json_files.append((f'{items_dir}{model_name}.json', item_template.replace(name_slot, name_bytes)))
+        # 3D模型JSON
+        json_files.append((f'{models_dir}{model_name}.json', model_template.replace(name_slot, name_bytes)))
+
+    # 大量小文件的创建和写入交给线程池并行（文件IO期间会释放GIL）
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(write_file, json_files))
 
     # 创建pack.mcmeta
     pack_meta = {"pack": {"pack_format": pack_format, "description": description}}
     os.makedirs(output_dir, exist_ok=True)
-    with open(os.path.join(output_dir, 'pack.mcmeta'), 'w') as f:
-        json.dump(pack_meta, f, indent=4)
+    with open(os.path.join(output_dir, 'pack.mcmeta'), 'wb') as f:
+        f.write(dumps_json(pack_meta))
 
     print(f"资源包生成完成！保存路径：{os.path.abspath(output_dir)}")
 